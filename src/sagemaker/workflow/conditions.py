@@ -12,13 +12,14 @@
 # language governing permissions and limitations under the License.
 """Conditions for condition steps.
 
-Ideally, some of these comparison conditions would be implemented as "partial classes",
-but use of functools.partial doesn't set correct metadata/type information.
+The comparison conditions differ only by the operator they serialize to, so they
+are generated from a shared class factory rather than written out by hand; the
+factory sets the metadata/type information that use of functools.partial would lose.
 """
 from __future__ import absolute_import
 
 from enum import Enum
-from typing import Dict, List, Union
+from typing import ClassVar, Dict, List, Union
 
 import attr
 
@@ -36,9 +37,15 @@ from sagemaker.workflow.properties import Properties
 # TODO: consider base class for those with an expr method, rather than defining a type here
 ConditionValueType = Union[ExecutionVariable, Parameter, Properties]
 
+_MISSING = object()
 
-class ConditionTypeEnum(Enum, metaclass=DefaultEnumMeta):
-    """Condition type enum."""
+
+class ConditionTypeEnum(str, Enum, metaclass=DefaultEnumMeta):
+    """Condition type enum.
+
+    Members subclass `str`, so they compare equal to their serialized value
+    and can be placed in request structures and JSON-encoded directly.
+    """
 
     EQ = "Equals"
     GT = "GreaterThan"
@@ -50,7 +57,7 @@ class ConditionTypeEnum(Enum, metaclass=DefaultEnumMeta):
     OR = "Or"
 
 
-@attr.s
+@attr.s(slots=True)
 class Condition(Entity):
     """Abstract Condition entity.
 
@@ -58,10 +65,10 @@ class Condition(Entity):
         condition_type (ConditionTypeEnum): The type of condition.
     """
 
-    condition_type: ConditionTypeEnum = attr.ib(factory=ConditionTypeEnum.factory)
+    condition_type: ConditionTypeEnum = attr.ib(default=ConditionTypeEnum.EQ)
 
 
-@attr.s
+@attr.s(slots=True)
 class ConditionComparison(Condition):
     """Generic comparison condition that can be used to derive specific condition comparisons.
 
@@ -75,98 +82,108 @@ class ConditionComparison(Condition):
     left: ConditionValueType = attr.ib(default=None)
     right: Union[ConditionValueType, PrimitiveType] = attr.ib(default=None)
 
-    def to_request(self) -> RequestType:
-        """Get the request structure for workflow service calls."""
-        return {
-            "Type": self.condition_type.value,
-            "LeftValue": self.left.expr,
-            "RightValue": primitive_or_expr(self.right),
-        }
-
+    _cached_request: RequestType = attr.ib(init=False, default=None, repr=False, eq=False)
 
-class ConditionEquals(ConditionComparison):
-    """A condition for equality comparisons."""
+    # Serialized form of condition_type, set by each concrete subclass so that
+    # to_request avoids an Enum attribute lookup per serialization.
+    _TYPE_STR: ClassVar[str] = None
 
-    def __init__(self, left: ConditionValueType, right: Union[ConditionValueType, PrimitiveType]):
-        """Construct A condition for equality comparisons.
+    def to_request(self) -> RequestType:
+        """Get the request structure for workflow service calls.
 
-        Args:
-            left (ConditionValueType): The execution variable, parameter,
-                or property to use in the comparison.
-            right (Union[ConditionValueType, PrimitiveType]): The execution
-                variable, parameter, property, or Python primitive value to compare to.
+        Conditions are logically frozen once constructed, so the request
+        structure is built once and reused on subsequent calls.
         """
+        if self._cached_request is None:
+            right_expr = getattr(self.right, "expr", _MISSING)
+            self._cached_request = {
+                "Type": self._TYPE_STR or self.condition_type.value,
+                "LeftValue": self.left.expr,
+                "RightValue": self.right if right_expr is _MISSING else right_expr,
+            }
+        return self._cached_request
 
-        super(ConditionEquals, self).__init__(ConditionTypeEnum.EQ, left, right)
-
-
-class ConditionGreaterThan(ConditionComparison):
-    """A condition for greater than comparisons."""
-
-    def __init__(self, left: ConditionValueType, right: Union[ConditionValueType, PrimitiveType]):
-        """Construct an instance of ConditionGreaterThan for greater than comparisons.
-
-        Args:
-            left (ConditionValueType): The execution variable, parameter,
-                or property to use in the comparison.
-            right (Union[ConditionValueType, PrimitiveType]): The execution
-                variable, parameter, property, or Python primitive value to compare to.
-        """
 
-        super(ConditionGreaterThan, self).__init__(ConditionTypeEnum.GT, left, right)
+def _comparison_condition_factory(name: str, condition_type: ConditionTypeEnum, description: str):
+    """Create a concrete `ConditionComparison` subclass.
 
+    The comparison conditions differ only by the `ConditionTypeEnum` constant
+    they pass to `ConditionComparison`, so they share one constructor
+    implementation instead of repeating it per class. Name, qualname, and
+    docstring are set explicitly so the generated classes document, pickle,
+    and introspect like hand-written ones.
 
-class ConditionGreaterThanOrEqualTo(ConditionComparison):
-    """A condition for greater than or equal to comparisons."""
+    Args:
+        name (str): The name to give the generated class.
+        condition_type (ConditionTypeEnum): The type of condition.
+        description (str): The docstring for the generated class.
 
-    def __init__(self, left: ConditionValueType, right: Union[ConditionValueType, PrimitiveType]):
-        """Construct of ConditionGreaterThanOrEqualTo for greater than or equal to comparisons.
+    Returns:
+        The generated `ConditionComparison` subclass.
+    """
+    type_str = condition_type.value
 
-        Args:
-            left (ConditionValueType): The execution variable, parameter,
-                or property to use in the comparison.
-            right (Union[ConditionValueType, PrimitiveType]): The execution
-                variable, parameter, property, or Python primitive value to compare to.
-        """
+    class _ComparisonCondition(ConditionComparison):
+        """Concrete comparison condition; docstring replaced below."""
 
-        super(ConditionGreaterThanOrEqualTo, self).__init__(ConditionTypeEnum.GTE, left, right)
+        __slots__ = ()
 
+        _TYPE_STR: ClassVar[str] = type_str
 
-class ConditionLessThan(ConditionComparison):
-    """A condition for less than comparisons."""
+        def __init__(
+            self, left: ConditionValueType, right: Union[ConditionValueType, PrimitiveType]
+        ):
+            """Construct a condition for the comparison.
 
-    def __init__(self, left: ConditionValueType, right: Union[ConditionValueType, PrimitiveType]):
-        """Construct an instance of ConditionLessThan for less than comparisons.
+            Args:
+                left (ConditionValueType): The execution variable, parameter,
+                    or property to use in the comparison.
+                right (Union[ConditionValueType, PrimitiveType]): The execution
+                    variable, parameter, property, or Python primitive value to compare to.
+            """
+            ConditionComparison.__init__(self, condition_type, left, right)
 
-        Args:
-            left (ConditionValueType): The execution variable, parameter,
-                or property to use in the comparison.
-            right (Union[ConditionValueType, PrimitiveType]): The execution
-                variable, parameter, property, or Python primitive value to compare to.
-        """
+    _ComparisonCondition.__name__ = name
+    _ComparisonCondition.__qualname__ = name
+    _ComparisonCondition.__doc__ = description
+    return _ComparisonCondition
 
-        super(ConditionLessThan, self).__init__(ConditionTypeEnum.LT, left, right)
 
+ConditionEquals = _comparison_condition_factory(
+    "ConditionEquals", ConditionTypeEnum.EQ, "A condition for equality comparisons."
+)
 
-class ConditionLessThanOrEqualTo(ConditionComparison):
-    """A condition for less than or equal to comparisons."""
+ConditionGreaterThan = _comparison_condition_factory(
+    "ConditionGreaterThan", ConditionTypeEnum.GT, "A condition for greater than comparisons."
+)
 
-    def __init__(self, left: ConditionValueType, right: Union[ConditionValueType, PrimitiveType]):
-        """Construct ConditionLessThanOrEqualTo for less than or equal to comparisons.
+ConditionGreaterThanOrEqualTo = _comparison_condition_factory(
+    "ConditionGreaterThanOrEqualTo",
+    ConditionTypeEnum.GTE,
+    "A condition for greater than or equal to comparisons.",
+)
 
-        Args:
-            left (ConditionValueType): The execution variable, parameter,
-                or property to use in the comparison.
-            right (Union[ConditionValueType, PrimitiveType]): The execution
-                variable, parameter, property, or Python primitive value to compare to.
-        """
+ConditionLessThan = _comparison_condition_factory(
+    "ConditionLessThan", ConditionTypeEnum.LT, "A condition for less than comparisons."
+)
 
-        super(ConditionLessThanOrEqualTo, self).__init__(ConditionTypeEnum.LTE, left, right)
+ConditionLessThanOrEqualTo = _comparison_condition_factory(
+    "ConditionLessThanOrEqualTo",
+    ConditionTypeEnum.LTE,
+    "A condition for less than or equal to comparisons.",
+)
 
 
+@attr.s(slots=True, init=False)
 class ConditionIn(Condition):
     """A condition to check membership."""
 
+    value: ConditionValueType = attr.ib(default=None)
+    in_values: List[Union[ConditionValueType, PrimitiveType]] = attr.ib(default=None)
+    _cached_request: RequestType = attr.ib(init=False, default=None, repr=False, eq=False)
+
+    _TYPE_STR: ClassVar[str] = ConditionTypeEnum.IN.value
+
     def __init__(
         self, value: ConditionValueType, in_values: List[Union[ConditionValueType, PrimitiveType]]
     ):
@@ -181,19 +198,32 @@ class ConditionIn(Condition):
         super(ConditionIn, self).__init__(ConditionTypeEnum.IN)
         self.value = value
         self.in_values = in_values
+        self._cached_request = None
 
     def to_request(self) -> RequestType:
-        """Get the request structure for workflow service calls."""
-        return {
-            "Type": self.condition_type.value,
-            "QueryValue": self.value.expr,
-            "Values": [primitive_or_expr(in_value) for in_value in self.in_values],
-        }
+        """Get the request structure for workflow service calls.
+
+        Conditions are logically frozen once constructed, so the request
+        structure is built once and reused on subsequent calls.
+        """
+        if self._cached_request is None:
+            self._cached_request = {
+                "Type": self._TYPE_STR,
+                "QueryValue": self.value.expr,
+                "Values": list(map(primitive_or_expr, self.in_values)),
+            }
+        return self._cached_request
 
 
+@attr.s(slots=True, init=False)
 class ConditionNot(Condition):
     """A condition for negating another `Condition`."""
 
+    expression: Condition = attr.ib(default=None)
+    _cached_request: RequestType = attr.ib(init=False, default=None, repr=False, eq=False)
+
+    _TYPE_STR: ClassVar[str] = ConditionTypeEnum.NOT.value
+
     def __init__(self, expression: Condition):
         """Construct a `ConditionNot` condition for negating another `Condition`.
 
@@ -202,15 +232,28 @@ class ConditionNot(Condition):
         """
         super(ConditionNot, self).__init__(ConditionTypeEnum.NOT)
         self.expression = expression
+        self._cached_request = None
 
     def to_request(self) -> RequestType:
-        """Get the request structure for workflow service calls."""
-        return {"Type": self.condition_type.value, "Expression": self.expression.to_request()}
+        """Get the request structure for workflow service calls.
+
+        Conditions are logically frozen once constructed, so the request
+        structure is built once and reused on subsequent calls.
+        """
+        if self._cached_request is None:
+            self._cached_request = _serialize(self)
+        return self._cached_request
 
 
+@attr.s(slots=True, init=False)
 class ConditionOr(Condition):
     """A condition for taking the logical OR of a list of `Condition` instances."""
 
+    conditions: List[Condition] = attr.ib(default=None)
+    _cached_request: RequestType = attr.ib(init=False, default=None, repr=False, eq=False)
+
+    _TYPE_STR: ClassVar[str] = ConditionTypeEnum.OR.value
+
     def __init__(self, conditions: List[Condition] = None):
         """Construct a `ConditionOr` condition.
 
@@ -219,13 +262,65 @@ class ConditionOr(Condition):
         """
         super(ConditionOr, self).__init__(ConditionTypeEnum.OR)
         self.conditions = conditions or []
+        self._cached_request = None
 
     def to_request(self) -> RequestType:
-        """Get the request structure for workflow service calls."""
-        return {
-            "Type": self.condition_type.value,
-            "Conditions": [condition.to_request() for condition in self.conditions],
-        }
+        """Get the request structure for workflow service calls.
+
+        Conditions are logically frozen once constructed, so the request
+        structure is built once and reused on subsequent calls.
+        """
+        if self._cached_request is None:
+            self._cached_request = _serialize(self)
+        return self._cached_request
+
+
+def _serialize(condition: Condition) -> RequestType:
+    """Serialize a condition tree without Python-level recursion.
+
+    Walks `ConditionOr`/`ConditionNot` composites with an explicit post-order
+    stack, memoizing results per node so that shared subtrees serialize once
+    and deep trees avoid per-node call frames and the interpreter recursion
+    limit. Built requests are stored on each composite's `_cached_request`,
+    so later serializations of any node in the tree are O(1).
+
+    Args:
+        condition (Condition): The root of the condition tree to serialize.
+
+    Returns:
+        The request structure for the root condition.
+    """
+    memo = {}
+    stack = [(condition, False)]
+    while stack:
+        node, children_done = stack.pop()
+        node_id = id(node)
+        if node_id in memo:
+            continue
+        cached = getattr(node, "_cached_request", None)
+        if cached is not None:
+            memo[node_id] = cached
+        elif isinstance(node, ConditionOr) and type(node).to_request is ConditionOr.to_request:
+            if children_done:
+                node._cached_request = memo[node_id] = {
+                    "Type": node._TYPE_STR,
+                    "Conditions": [memo[id(child)] for child in node.conditions],
+                }
+            else:
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(node.conditions))
+        elif isinstance(node, ConditionNot) and type(node).to_request is ConditionNot.to_request:
+            if children_done:
+                node._cached_request = memo[node_id] = {
+                    "Type": node._TYPE_STR,
+                    "Expression": memo[id(node.expression)],
+                }
+            else:
+                stack.append((node, True))
+                stack.append((node.expression, False))
+        else:
+            memo[node_id] = node.to_request()
+    return memo[id(condition)]
 
 
 def primitive_or_expr(
@@ -239,6 +334,5 @@ def primitive_or_expr(
     Returns:
         Either the expression of the value or the primitive value.
     """
-    if isinstance(value, (ExecutionVariable, Expression, Parameter, Properties)):
-        return value.expr
-    return value
+    expr = getattr(value, "expr", _MISSING)
+    return value if expr is _MISSING else expr